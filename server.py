@@ -1,12 +1,24 @@
 """FastMCP-based Pandoc server module."""
 
 import asyncio
+import multiprocessing
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from types import SimpleNamespace
 from typing import Annotated, Literal
 
-import yaml
 from fastmcp import FastMCP
 
+# True when this module is being re-imported inside a spawned pool worker.
+# Workers only need the module's definitions (and the Pandoc env vars below);
+# they must not repeat the download/version probing or create their own pool.
+# The process name is checked rather than parent_process() because spawn sets
+# the worker's name before re-importing modules, while parent_process() is
+# only populated after bootstrap.
+_IS_POOL_WORKER = multiprocessing.current_process().name != "MainProcess"
+
 # Set up Pandoc path BEFORE importing pypandoc
 pandoc_dir = os.path.abspath("./pandoc_bin")
 pandoc_exe = os.path.join(pandoc_dir, "pandoc.exe" if os.name == "nt" else "pandoc")
@@ -23,77 +35,191 @@ if os.path.exists(pandoc_exe):
 # Now import pypandoc after environment is configured
 import pypandoc  # noqa: E402
 
-try:
-    # Only download if pandoc doesn't exist
-    if not os.path.exists(pandoc_exe):
-        print(f"Pandoc not found. Downloading to: {pandoc_dir}")
-        os.makedirs(pandoc_dir, exist_ok=True)
+_pandoc_version = None
 
-        # Download pandoc to the directory
-        pypandoc.download_pandoc(
-            targetfolder=pandoc_dir, download_folder=pandoc_dir, delete_installer=True
-        )
-        print("Pandoc downloaded successfully")
+if not _IS_POOL_WORKER:
+    try:
+        # Only download if pandoc doesn't exist
+        if not os.path.exists(pandoc_exe):
+            print(f"Pandoc not found. Downloading to: {pandoc_dir}")
+            os.makedirs(pandoc_dir, exist_ok=True)
+
+            # Download pandoc to the directory
+            pypandoc.download_pandoc(
+                targetfolder=pandoc_dir,
+                download_folder=pandoc_dir,
+                delete_installer=True,
+            )
+            print("Pandoc downloaded successfully")
 
-        # Re-set environment variables after download
-        os.environ["PYPANDOC_PANDOC"] = pandoc_exe
-        pandoc_dir_normalized = os.path.normpath(pandoc_dir)
-        os.environ["PATH"] = (
-            f"{pandoc_dir_normalized}{os.pathsep}{os.environ.get('PATH', '')}"
-        )
-    else:
-        print(f"Using existing Pandoc at: {pandoc_exe}")
+            # Re-set environment variables after download
+            os.environ["PYPANDOC_PANDOC"] = pandoc_exe
+            pandoc_dir_normalized = os.path.normpath(pandoc_dir)
+            os.environ["PATH"] = (
+                f"{pandoc_dir_normalized}{os.pathsep}{os.environ.get('PATH', '')}"
+            )
+        else:
+            print(f"Using existing Pandoc at: {pandoc_exe}")
 
-    # Verify pypandoc can find it
-    if os.path.exists(pandoc_exe):
-        print(f"Pandoc initialized successfully at: {pandoc_exe}")
-        try:
-            version = pypandoc.get_pandoc_version()
-            print(f"Pandoc version: {version}")
-        except Exception as ve:
-            print(f"Warning: Could not verify Pandoc version: {ve}")
-    else:
-        print(f"Pandoc executable not found at expected location: {pandoc_exe}")
+        # Verify pypandoc can find it
+        if os.path.exists(pandoc_exe):
+            print(f"Pandoc initialized successfully at: {pandoc_exe}")
+            try:
+                _pandoc_version = pypandoc.get_pandoc_version()
+                print(f"Pandoc version: {_pandoc_version}")
+            except Exception as ve:
+                print(f"Warning: Could not verify Pandoc version: {ve}")
+        else:
+            print(f"Pandoc executable not found at expected location: {pandoc_exe}")
+            print("Attempting to use system Pandoc...")
+    except Exception as e:
+        print(f"Error initializing Pandoc: {e}")
         print("Attempting to use system Pandoc...")
-except Exception as e:
-    print(f"Error initializing Pandoc: {e}")
-    print("Attempting to use system Pandoc...")
 
 # Initialize FastMCP server
 mcp = FastMCP("File MCP")
 
+# Bounded process pool for Pandoc conversions. Each conversion spawns a
+# pandoc subprocess with pipe I/O and decoding on the Python side, so a
+# process pool lets concurrent MCP calls run truly in parallel instead of
+# contending for the GIL in worker threads. Workers are spawned lazily on
+# first use, with an explicit spawn context: forking from the already-threaded
+# event-loop process is deadlock-prone (and deprecated since 3.12), and spawn
+# is the only start method on Windows anyway. Spawned workers re-import this
+# module, so they get no pool of their own.
+_POOL = (
+    None
+    if _IS_POOL_WORKER
+    else ProcessPoolExecutor(
+        max_workers=min(8, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+)
+
+
+def _run_pandoc(func, *args, env: dict[str, str] | None = None, **kwargs):
+    """Run a pypandoc conversion with per-call environment variables.
+
+    pypandoc does not expose an env parameter for the pandoc subprocess, so
+    the variables are applied to the worker process's own environment, which
+    the subprocess inherits. Because this runs inside a pool worker, it never
+    races with the server process or other concurrent conversions.
+    """
+    if env:
+        os.environ.update(env)
+    return func(*args, **kwargs)
+
 
 # Helper functions
-def _infer_format_from_extension(file_path: str) -> str:
-    """Infer the format from file extension."""
-    ext_to_format = {
-        ".txt": "plain",
-        ".html": "html",
-        ".htm": "html",
-        ".md": "markdown",
-        ".markdown": "markdown",
-        ".ipynb": "ipynb",
-        ".odt": "odt",
-        ".pdf": "pdf",
-        ".docx": "docx",
-        ".doc": "docx",
-        ".rst": "rst",
-        ".tex": "latex",
-        ".latex": "latex",
-        ".epub": "epub",
-    }
+# "to" fields of defaults files that already passed the full parse and
+# structure checks, keyed by (abspath, mtime). A hit means the validator can
+# skip the guarded parse block entirely — only the "to" field is kept since
+# that is all the validator uses. Bounded FIFO so the dict stays small.
+_DEFAULTS_CACHE: dict[tuple[str, float], str | None] = {}
+_DEFAULTS_CACHE_MAX = 128
+
+
+@lru_cache(maxsize=1)
+def _yaml_safe_loader():
+    """Pick the LibYAML C safe loader when available; it is much faster than
+    the pure-Python parser for the same safe-loading semantics."""
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
 
-    # Get file extension (lowercase)
-    _, ext = os.path.splitext(file_path)
-    ext = ext.lower()
 
-    if ext not in ext_to_format:
+def _parse_defaults_to(path: str) -> str | None:
+    """Parse a defaults YAML file and return its "to" field."""
+    import yaml
+
+    with open(path, "rb") as f:
+        yaml_content = yaml.load(f.read(), Loader=_yaml_safe_loader())
+
+    # Validate the YAML structure
+    if not isinstance(yaml_content, dict):
         raise ValueError(
-            f"Unsupported file extension: '{ext}'. "
-            f"Supported extensions: {', '.join(ext_to_format.keys())}"
+            f"Invalid defaults file format: {path} - must be a YAML dictionary"
         )
 
-    return ext_to_format[ext]
+    return yaml_content.get("to")
+
+
+# Mapping of file extensions to Pandoc format names
+_EXT_TO_FORMAT = {
+    ".txt": "plain",
+    ".html": "html",
+    ".htm": "html",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".ipynb": "ipynb",
+    ".odt": "odt",
+    ".pdf": "pdf",
+    ".docx": "docx",
+    ".doc": "docx",
+    ".rst": "rst",
+    ".tex": "latex",
+    ".latex": "latex",
+    ".epub": "epub",
+}
+_SUPPORTED_EXTS_STR = ", ".join(_EXT_TO_FORMAT)
+_UNSUPPORTED_EXT_MSG = (
+    "Unsupported file extension: '%s'. Supported extensions: " + _SUPPORTED_EXTS_STR
+)
+
+# Output formats accepted by the conversion tools
+_SUPPORTED_OUTPUT_FORMATS = frozenset(
+    {"html", "markdown", "pdf", "docx", "rst", "latex", "epub", "txt", "ipynb", "odt"}
+)
+_SUPPORTED_OUTPUT_STR = ", ".join(sorted(_SUPPORTED_OUTPUT_FORMATS))
+_UNSUPPORTED_FMT_MSG = (
+    "Unsupported output format: '%s'. Supported formats are: " + _SUPPORTED_OUTPUT_STR
+)
+
+
+@lru_cache(maxsize=512)
+def _infer_format_from_extension(file_path: str) -> str:
+    """Infer the format from file extension."""
+    # Get file extension (lowercase)
+    ext = os.path.splitext(file_path)[1].lower()
+
+    fmt = _EXT_TO_FORMAT.get(ext)
+    if fmt is None:
+        raise ValueError(_UNSUPPORTED_EXT_MSG % ext)
+
+    return fmt
+
+
+# Successful validation verdicts keyed on the parameter tuple plus the mtimes
+# of any referenced files, so repeat calls with unchanged arguments skip the
+# validator entirely. Bounded FIFO to keep the dict from growing without limit.
+_VALIDATION_CACHE: dict[tuple, None] = {}
+_VALIDATION_CACHE_MAX = 128
+
+
+def _validation_cache_key(
+    output_format: str,
+    reference_doc: str | None,
+    filters: list[str] | None,
+    defaults_file: str | None,
+) -> tuple | None:
+    """Build a hashable validation cache key, or None if the call isn't cacheable."""
+    try:
+        key = (
+            output_format,
+            reference_doc,
+            os.path.getmtime(reference_doc) if reference_doc else None,
+            tuple(filters) if filters else None,
+            defaults_file,
+            os.path.getmtime(defaults_file) if defaults_file else None,
+        )
+        hash(key)
+    except (OSError, TypeError):
+        # Missing referenced files or non-string filter entries: run the full
+        # validator so it raises its own error
+        return None
+    return key
 
 
 def _validate_conversion_params(
@@ -103,6 +229,11 @@ def _validate_conversion_params(
     defaults_file: str | None,
 ) -> None:
     """Validate common conversion parameters."""
+    # Return immediately if this exact parameter set already validated
+    key = _validation_cache_key(output_format, reference_doc, filters, defaults_file)
+    if key is not None and key in _VALIDATION_CACHE:
+        return
+
     # Validate reference_doc if provided
     if reference_doc:
         if output_format != "docx":
@@ -112,75 +243,136 @@ def _validate_conversion_params(
         if not os.path.exists(reference_doc):
             raise ValueError(f"Reference document not found: {reference_doc}")
 
-    # Validate defaults_file if provided
+    # Validate defaults_file if provided. No separate existence check — the
+    # stat/open below raises FileNotFoundError itself, saving a syscall.
     if defaults_file:
-        if not os.path.exists(defaults_file):
-            raise ValueError(f"Defaults file not found: {defaults_file}")
-
-        # Check if it's a valid YAML file and readable
         try:
-            with open(defaults_file) as f:
-                yaml_content = yaml.safe_load(f)
-
-            # Validate the YAML structure
-            if not isinstance(yaml_content, dict):
-                raise ValueError(
-                    f"Invalid defaults file format: {defaults_file} - must be a YAML dictionary"
-                )
-
-            # Check if the defaults file specifies an output format that conflicts
-            if "to" in yaml_content and yaml_content["to"] != output_format:
-                print(
-                    f"Warning: Defaults file specifies output format '{yaml_content['to']}' "
-                    f"but requested format is '{output_format}'. Using requested format."
-                )
-
-        except yaml.YAMLError as e:
-            raise ValueError(
-                f"Error parsing defaults file {defaults_file}: {str(e)}"
-            ) from e
-        except PermissionError as e:
-            raise ValueError(
-                f"Permission denied when reading defaults file: {defaults_file}"
-            ) from e
-        except Exception as e:
+            defaults_key = (
+                os.path.abspath(defaults_file),
+                os.path.getmtime(defaults_file),
+            )
+        except FileNotFoundError as e:
+            raise ValueError(f"Defaults file not found: {defaults_file}") from e
+        except OSError as e:
             raise ValueError(
                 f"Error reading defaults file {defaults_file}: {str(e)}"
             ) from e
 
-    # Define supported formats
-    supported_formats = {
-        "html",
-        "markdown",
-        "pdf",
-        "docx",
-        "rst",
-        "latex",
-        "epub",
-        "txt",
-        "ipynb",
-        "odt",
-    }
-    if output_format not in supported_formats:
-        raise ValueError(
-            f"Unsupported output format: '{output_format}'. "
-            f"Supported formats are: {', '.join(supported_formats)}"
-        )
+        if defaults_key in _DEFAULTS_CACHE:
+            # Already parsed and validated; skip the guarded parse entirely
+            defaults_to = _DEFAULTS_CACHE[defaults_key]
+        else:
+            # yaml is only needed on a cache miss; after the first import this
+            # is just a sys.modules lookup
+            import yaml
+
+            # Check if it's a valid YAML file and readable
+            try:
+                defaults_to = _parse_defaults_to(defaults_key[0])
+            except yaml.YAMLError as e:
+                raise ValueError(
+                    f"Error parsing defaults file {defaults_file}: {str(e)}"
+                ) from e
+            except FileNotFoundError as e:
+                raise ValueError(f"Defaults file not found: {defaults_file}") from e
+            except PermissionError as e:
+                raise ValueError(
+                    f"Permission denied when reading defaults file: {defaults_file}"
+                ) from e
+            except Exception as e:
+                raise ValueError(
+                    f"Error reading defaults file {defaults_file}: {str(e)}"
+                ) from e
+
+            if len(_DEFAULTS_CACHE) >= _DEFAULTS_CACHE_MAX:
+                _DEFAULTS_CACHE.pop(next(iter(_DEFAULTS_CACHE)))
+            _DEFAULTS_CACHE[defaults_key] = defaults_to
+
+        # Check if the defaults file specifies an output format that conflicts
+        if defaults_to is not None and defaults_to != output_format:
+            print(
+                f"Warning: Defaults file specifies output format '{defaults_to}' "
+                f"but requested format is '{output_format}'. Using requested format."
+            )
+
+    # Check against the supported output formats
+    if output_format not in _SUPPORTED_OUTPUT_FORMATS:
+        raise ValueError(_UNSUPPORTED_FMT_MSG % output_format)
 
-    # Validate filters if provided
+    # Validate filters if provided (exact type checks are faster than
+    # isinstance on this hot path)
     if filters:
-        if not isinstance(filters, list):
+        if type(filters) is not list:
             raise ValueError("filters parameter must be a list of strings")
 
-        for filter_path in filters:
-            if not isinstance(filter_path, str):
-                raise ValueError("Each filter must be a string path")
+        if not all(type(f) is str for f in filters):
+            raise ValueError("Each filter must be a string path")
+
+    # Record the verdict so identical follow-up calls can short-circuit
+    if key is not None:
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_MAX:
+            _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)))
+        _VALIDATION_CACHE[key] = None
+
+
+# Directory Pandoc conventionally searches for user filters
+_PANDOC_FILTERS_DIR = os.path.join(os.path.expanduser("~"), ".pandoc", "filters")
+
+
+@lru_cache(maxsize=1)
+def _pandoc_filters_listing(mtime: float) -> frozenset[str]:
+    """List the entry names in ~/.pandoc/filters, cached per directory mtime.
+
+    A single scandir replaces one stat per filter per request; the mtime in
+    the cache key invalidates the listing when the directory changes.
+    """
+    with os.scandir(_PANDOC_FILTERS_DIR) as entries:
+        return frozenset(entry.name for entry in entries)
+
+
+def _pandoc_filters_candidate(filter_name: str) -> str | None:
+    """Return the ~/.pandoc/filters candidate path if the name exists there."""
+    try:
+        mtime = os.path.getmtime(_PANDOC_FILTERS_DIR)
+    except OSError:
+        return None
+
+    if filter_name in _pandoc_filters_listing(mtime):
+        return os.path.join(_PANDOC_FILTERS_DIR, filter_name)
+    return None
+
+
+# Successfully resolved filter paths keyed by (filter_path, defaults_file),
+# each entry holding (resolved_path, mtime). Failed resolutions are never
+# cached, so a filter that appears (or is fixed) after a failed lookup is
+# found on the next call; entries are revalidated against the file's current
+# stat and dropped when stale. Bounded FIFO like _DEFAULTS_CACHE.
+_FILTER_PATH_CACHE: dict[tuple[str, str | None], tuple[str, float]] = {}
+_FILTER_PATH_CACHE_MAX = 256
 
 
 def _resolve_filter_path(
     filter_path: str, defaults_file: str | None = None
 ) -> str | None:
-    """Resolve a filter path by trying multiple possible locations."""
+    """Resolve a filter path by trying multiple possible locations.
+
+    Successful resolutions are cached per (filter_path, defaults_file) and
+    revalidated with a single stat, so the full path probe, chmod fix-up, and
+    logging only happen the first time a filter is seen or after it changes.
+    """
+    # Reuse a cached resolution while the file is unchanged and executable
+    cache_key = (filter_path, defaults_file)
+    entry = _FILTER_PATH_CACHE.get(cache_key)
+    if entry is not None:
+        resolved, mtime = entry
+        try:
+            st = os.stat(resolved)
+        except OSError:
+            st = None
+        if st is not None and st.st_mtime == mtime and st.st_mode & 0o111:
+            return resolved
+        del _FILTER_PATH_CACHE[cache_key]
+
     # If it's already an absolute path, just use it
     if os.path.isabs(filter_path):
         paths = [filter_path]
@@ -189,41 +381,43 @@ def _resolve_filter_path(
         paths = [
             # 1. Relative to current working directory
             os.path.abspath(filter_path),
-            # 2. Relative to the defaults file directory (if provided)
+            # 2. Relative to the defaults file directory (if provided; the
+            # caller passes an already-absolute path)
             (
-                os.path.join(
-                    os.path.dirname(os.path.abspath(defaults_file)), filter_path
-                )
+                os.path.join(os.path.dirname(defaults_file), filter_path)
                 if defaults_file
                 else None
             ),
-            # 3. Relative to the .pandoc/filters directory
-            os.path.join(
-                os.path.expanduser("~"),
-                ".pandoc",
-                "filters",
-                os.path.basename(filter_path),
-            ),
+            # 3. Relative to the .pandoc/filters directory (consults the
+            # cached directory listing, so absent names cost no stat)
+            _pandoc_filters_candidate(os.path.basename(filter_path)),
         ]
         # Remove None entries
         paths = [p for p in paths if p]
 
-    # Try each path
+    # Try each path with a single stat per candidate
     for path in paths:
-        if os.path.exists(path):
-            # Check if executable and try to make it executable if not
-            if not os.access(path, os.X_OK):
-                try:
-                    os.chmod(path, os.stat(path).st_mode | 0o111)
-                    print(f"Made filter executable: {path}")
-                except Exception as e:
-                    print(
-                        f"Warning: Could not make filter executable: {path} - {str(e)}"
-                    )
-                    continue
-
-            print(f"Using filter: {path}")
-            return path
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+
+        # Check if executable and try to make it executable if not
+        if not (st.st_mode & 0o111):
+            try:
+                os.chmod(path, st.st_mode | 0o111)
+                print(f"Made filter executable: {path}")
+            except Exception as e:
+                print(f"Warning: Could not make filter executable: {path} - {str(e)}")
+                continue
+
+        print(f"Using filter: {path}")
+        if len(_FILTER_PATH_CACHE) >= _FILTER_PATH_CACHE_MAX:
+            _FILTER_PATH_CACHE.pop(next(iter(_FILTER_PATH_CACHE)))
+        # chmod changes ctime, not mtime, so the stat from the probe is
+        # still the right timestamp to validate against
+        _FILTER_PATH_CACHE[cache_key] = (path, st.st_mtime)
+        return path
 
     return None
 
@@ -246,6 +440,25 @@ def _validate_filters(
     return validated_filters
 
 
+@lru_cache(maxsize=1)
+def _find_latex_engine() -> str | None:
+    """Find an available LaTeX engine, cached for the process lifetime."""
+    for engine in ("xelatex", "pdflatex", "lualatex"):
+        if shutil.which(engine):
+            return engine
+    return None
+
+
+# Pandoc capabilities resolved once at import: the version already probed
+# during initialization (a subprocess call) and the available LaTeX engine
+# (a $PATH walk). Per-call code reads these instead of re-probing. Only the
+# server process consults _CAPS, so pool workers skip the engine probe.
+_CAPS = SimpleNamespace(
+    version=_pandoc_version,
+    latex_engine=None if _IS_POOL_WORKER else _find_latex_engine(),
+)
+
+
 def _format_result_info(
     filters: list[str] | None = None,
     defaults_file: str | None = None,
@@ -272,42 +485,38 @@ def _prepare_conversion_args(
     reference_doc: str | None,
     filters: list[str] | None,
     defaults_file: str | None,
-) -> list[str]:
-    """Prepare extra arguments for Pandoc conversion."""
+) -> tuple[list[str], list[str], dict[str, str]]:
+    """Prepare extra arguments, validated filters, and env for Pandoc conversion."""
     extra_args = []
+    validated_filters = []
+    env = {}
+
+    # Normalize paths once and reuse them below
+    defaults_file_abs = os.path.abspath(defaults_file) if defaults_file else None
 
     # Add defaults file if provided
-    if defaults_file:
-        defaults_file_abs = os.path.abspath(defaults_file)
+    if defaults_file_abs:
         extra_args.extend(["--defaults", defaults_file_abs])
 
     # Set environment variables for filters
     if output_file:
-        # Set PANDOC_OUTPUT_DIR to the directory of the output file
-        output_dir = os.path.dirname(os.path.abspath(output_file))
-        os.environ["PANDOC_OUTPUT_DIR"] = output_dir
-
-    # Handle filter arguments
+        # Point PANDOC_OUTPUT_DIR at the output file's directory; applied
+        # per call in the conversion worker instead of mutating this
+        # process's environment
+        output_file_abs = os.path.abspath(output_file)
+        env["PANDOC_OUTPUT_DIR"] = os.path.dirname(output_file_abs)
+
+    # Handle filter arguments (pass the already-normalized defaults path so
+    # the resolver doesn't re-abspath it per filter)
     if filters:
-        validated_filters = _validate_filters(filters, defaults_file)
+        validated_filters = _validate_filters(filters, defaults_file_abs)
         for filter_path in validated_filters:
             extra_args.extend(["--filter", filter_path])
 
     # Handle PDF-specific conversion if needed
     if output_format == "pdf":
-        # Try to find LaTeX engine
-        latex_engines = ["xelatex", "pdflatex", "lualatex"]
-        engine_found = None
-
-        for engine in latex_engines:
-            try:
-                import shutil
-
-                if shutil.which(engine):
-                    engine_found = engine
-                    break
-            except Exception:
-                continue
+        # Use the LaTeX engine resolved at import
+        engine_found = _CAPS.latex_engine
 
         if not engine_found:
             raise ValueError(
@@ -321,7 +530,14 @@ def _prepare_conversion_args(
     if reference_doc and output_format == "docx":
         extra_args.extend(["--reference-doc", reference_doc])
 
-    return extra_args
+    return extra_args, validated_filters, env
+
+
+# Substring needles for classifying conversion errors, compiled once. The
+# filter needles match any; the missing-pandoc needles must all appear in the
+# case-folded error text.
+_FILTER_ERROR_NEEDLES = ("Filter not found", "Filter is not executable")
+_PANDOC_MISSING_NEEDLES = ("pandoc", "not found")
 
 
 def _format_error_message(
@@ -334,16 +550,14 @@ def _format_error_message(
     """Format error message for Pandoc conversion errors."""
     error_prefix = "Error converting"
     error_details = str(e)
+    error_details_lc = error_details.lower()
 
-    if (
-        "Filter not found" in error_details
-        or "Filter is not executable" in error_details
-    ):
+    if any(needle in error_details for needle in _FILTER_ERROR_NEEDLES):
         error_prefix = "Filter error during conversion"
     elif "defaults" in error_details and defaults_file:
         error_prefix = "Defaults file error during conversion"
         error_details += f" (defaults file: {defaults_file})"
-    elif "pandoc" in error_details.lower() and "not found" in error_details.lower():
+    elif all(needle in error_details_lc for needle in _PANDOC_MISSING_NEEDLES):
         error_prefix = "Pandoc executable not found"
         error_details = "Please ensure Pandoc is installed and available in your PATH"
 
@@ -411,21 +625,24 @@ async def create_file(
     _validate_conversion_params(output_format, reference_doc, filters, defaults_file)
 
     try:
-        # Get conversion arguments
-        extra_args = _prepare_conversion_args(
+        # Get conversion arguments (filters are validated once here)
+        extra_args, validated_filters, env = _prepare_conversion_args(
             output_format, output_file, reference_doc, filters, defaults_file
         )
 
-        validated_filters = _validate_filters(filters, defaults_file) if filters else []
-
-        # Convert content to file (run in thread to avoid blocking)
-        await asyncio.to_thread(
-            pypandoc.convert_text,
-            content,
-            output_format,
-            format=input_format,
-            outputfile=output_file,
-            extra_args=extra_args,
+        # Convert content to file (run in a worker process to avoid blocking)
+        await asyncio.get_running_loop().run_in_executor(
+            _POOL,
+            partial(
+                _run_pandoc,
+                pypandoc.convert_text,
+                content,
+                output_format,
+                env=env,
+                format=input_format,
+                outputfile=output_file,
+                extra_args=extra_args,
+            ),
         )
 
         # Create result message with filter and defaults information
@@ -497,21 +714,24 @@ async def convert_file(
     _validate_conversion_params(output_format, reference_doc, filters, defaults_file)
 
     try:
-        # Get conversion arguments
-        extra_args = _prepare_conversion_args(
+        # Get conversion arguments (filters are validated once here)
+        extra_args, validated_filters, env = _prepare_conversion_args(
             output_format, output_file, reference_doc, filters, defaults_file
         )
 
-        validated_filters = _validate_filters(filters, defaults_file) if filters else []
-
-        # Convert file to file (run in thread to avoid blocking)
-        await asyncio.to_thread(
-            pypandoc.convert_file,
-            input_file,
-            output_format,
-            outputfile=output_file,
-            format=input_format,
-            extra_args=extra_args,
+        # Convert file to file (run in a worker process to avoid blocking)
+        await asyncio.get_running_loop().run_in_executor(
+            _POOL,
+            partial(
+                _run_pandoc,
+                pypandoc.convert_file,
+                input_file,
+                output_format,
+                env=env,
+                outputfile=output_file,
+                format=input_format,
+                extra_args=extra_args,
+            ),
         )
 
         # Create result message with filter and defaults information